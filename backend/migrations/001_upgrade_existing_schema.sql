@@ -0,0 +1,32 @@
+-- Upgrade a database created by an earlier version of the backend.
+--
+-- New databases do not need this: startup runs Base.metadata.create_all, which creates the
+-- tables with this schema. create_all never alters existing tables, so databases created
+-- before these changes must apply the statements below once, by hand:
+--
+--   mysql -h "$MYSQL_HOST" -u "$MYSQL_USER" -p "$MYSQL_DB" < migrations/001_upgrade_existing_schema.sql
+--
+-- Restart the backend afterwards: test case search checks for the FULLTEXT index once per
+-- process and uses a LIKE contains match until the index exists.
+
+-- Composite indexes for suite paging and the category/priority filters; they replace the
+-- single-column indexes dropped below.
+CREATE INDEX idx_test_cases_suite_created ON test_cases (suite_id, created_at, id);
+CREATE INDEX idx_test_cases_suite_category ON test_cases (suite_id, category);
+CREATE INDEX idx_test_cases_suite_priority ON test_cases (suite_id, priority);
+-- Strict prefix of idx_test_cases_suite_created, which now also serves the suite_id foreign key
+-- (so it must be created first).
+DROP INDEX ix_test_cases_suite_id ON test_cases;
+DROP INDEX ix_test_cases_priority ON test_cases;
+DROP INDEX ix_test_cases_category ON test_cases;
+DROP INDEX ix_test_cases_subcategory ON test_cases;
+
+-- FULLTEXT index backing MATCH ... AGAINST in the test case search filter.
+ALTER TABLE test_cases ADD FULLTEXT INDEX idx_test_cases_search (title, description, case_id);
+
+-- created_at is filled in by MySQL (connections run in UTC, see src/api/db.py).
+ALTER TABLE suites MODIFY created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE test_cases MODIFY created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP;
+
+-- steps/tags become native JSON columns; existing values are already valid JSON text.
+ALTER TABLE test_cases MODIFY steps JSON NULL, MODIFY tags JSON NULL;
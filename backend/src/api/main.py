@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
 
 from src.api.db import get_engine
 from src.api.models import Base
@@ -23,6 +28,8 @@ app = FastAPI(
     description="Backend API for importing WiFi test plans (CSV/XLSX) and serving suites/test cases.",
     version="0.2.0",
     openapi_tags=openapi_tags,
+    # orjson encodes response bodies (incl. datetimes) natively instead of stdlib json.
+    default_response_class=ORJSONResponse,
 )
 
 # CORS notes:
@@ -32,8 +39,6 @@ app = FastAPI(
 # Env override:
 # - BACKEND_CORS_ORIGINS: comma-separated list of allowed origins.
 #   Example: "http://localhost:3000,https://your-preview-host"
-import os
-
 _default_cors_origins = [
     "http://localhost:3000",
     "http://127.0.0.1:3000",
@@ -42,8 +47,11 @@ _default_cors_origins = [
     "http://127.0.0.1:3001",
 ]
 _env_origins = os.getenv("BACKEND_CORS_ORIGINS", "").strip()
-allow_origins = (
-    [o.strip() for o in _env_origins.split(",") if o.strip()] if _env_origins else _default_cors_origins
+# Resolved once at import into an explicit list (duplicates dropped, order preserved).
+allow_origins = list(
+    dict.fromkeys(
+        [o.strip() for o in _env_origins.split(",") if o.strip()] if _env_origins else _default_cors_origins
+    )
 )
 
 app.add_middleware(
@@ -55,15 +63,48 @@ app.add_middleware(
 )
 
 
+_SCHEMA_LOCK_NAME = "test_item_classifier_schema"
+_SCHEMA_LOCK_TIMEOUT_S = 60
+
+
+def _ensure_tables(engine: Engine) -> None:
+    """
+    Create missing tables, issuing DDL only when something is actually missing.
+
+    A single table listing short-circuits the common case (schema already present). Otherwise
+    a MySQL advisory lock (GET_LOCK) makes concurrently booting workers take turns, so only the
+    first one runs CREATE TABLE and the rest find the tables in place. Raises RuntimeError if the
+    lock cannot be acquired, rather than running DDL unguarded.
+    """
+    existing = set(inspect(engine).get_table_names())
+    if all(t.name in existing for t in Base.metadata.sorted_tables):
+        return
+
+    with engine.connect() as conn:
+        params = {"name": _SCHEMA_LOCK_NAME, "timeout": _SCHEMA_LOCK_TIMEOUT_S}
+        # 1 = acquired, 0 = timed out, NULL = error.
+        acquired = conn.execute(text("SELECT GET_LOCK(:name, :timeout)"), params).scalar()
+        if acquired != 1:
+            raise RuntimeError(
+                f"Could not acquire schema lock {_SCHEMA_LOCK_NAME!r} within {_SCHEMA_LOCK_TIMEOUT_S}s "
+                f"(GET_LOCK returned {acquired!r})."
+            )
+        try:
+            Base.metadata.create_all(bind=conn)  # checkfirst: skips tables created meanwhile
+            conn.commit()
+        finally:
+            conn.execute(text("SELECT RELEASE_LOCK(:name)"), params)
+
+
 @app.on_event("startup")
 async def _startup_create_tables() -> None:
     """
-    Create database tables if they do not exist.
+    Initialize the engine/session factory and create database tables if they do not exist.
 
+    Must run before serving traffic: get_db() expects the session factory to exist.
     Uses MYSQL_* environment variables for connection. If not set, startup may fail.
     """
-    engine = get_engine()
-    Base.metadata.create_all(bind=engine)
+    _ensure_tables(get_engine())
 
 
 @app.get("/", tags=["Health"], summary="Health check", operation_id="health_check")
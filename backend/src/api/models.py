@@ -4,17 +4,19 @@ SQLAlchemy ORM models for imported test plans.
 Schema (minimal):
 - suites(id PK, name, created_at)
 - test_cases(id PK, suite_id FK, case_id, title, description, priority, category, subcategory,
-             preconditions, steps TEXT, expected_result, tags TEXT, created_at)
+             preconditions, steps JSON, expected_result, tags JSON, created_at)
 
-Note: steps/tags are stored as JSON text for portability/simplicity.
+Note: steps/tags use MySQL's native JSON type; SQLAlchemy (de)serializes Python lists.
+created_at is filled in by the database (DEFAULT now()); sessions run in UTC (see db.py).
 """
 
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy.dialects.mysql import JSON as MySQLJSON
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -29,12 +31,13 @@ class Suite(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now())
 
+    # Default lazy loading: suite lookups must not pull every test case. Queries that need the
+    # collection should opt in with .options(selectinload(Suite.test_cases)).
     test_cases: Mapped[List["TestCase"]] = relationship(
         back_populates="suite",
         cascade="all, delete-orphan",
-        lazy="selectin",
     )
 
 
@@ -45,7 +48,8 @@ class TestCase(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
-    suite_id: Mapped[int] = mapped_column(Integer, ForeignKey("suites.id"), nullable=False, index=True)
+    # No single-column index: idx_test_cases_suite_created leads with suite_id and backs the FK.
+    suite_id: Mapped[int] = mapped_column(Integer, ForeignKey("suites.id"), nullable=False)
     suite: Mapped[Suite] = relationship(back_populates="test_cases")
 
     # "case_id" corresponds to normalized test case identifier (e.g. wifistat-001).
@@ -54,24 +58,33 @@ class TestCase(Base):
     title: Mapped[str] = mapped_column(String(512), nullable=False)
 
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    priority: Mapped[Optional[str]] = mapped_column(String(32), nullable=True, index=True)
-    category: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
-    subcategory: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
+    priority: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+    category: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    subcategory: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     preconditions: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    # JSON text of array of step strings (or dicts), depending on parser output.
-    steps: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # JSON array of step strings (or dicts), depending on parser output. None is stored as SQL NULL.
+    steps: Mapped[Optional[List[Any]]] = mapped_column(MySQLJSON(none_as_null=True), nullable=True)
 
     expected_result: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    # JSON text of array of tag strings.
-    tags: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # JSON array of tag strings. None is stored as SQL NULL.
+    tags: Mapped[Optional[List[str]]] = mapped_column(MySQLJSON(none_as_null=True), nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now())
 
     __table_args__ = (
         # Prevent duplicate imports of the same case_id within the same suite (best-effort).
         UniqueConstraint("suite_id", "case_id", name="uq_suite_case_id"),
         Index("idx_test_cases_title", "title"),
+        # Composite indexes matching list_suite_testcases: the paging order
+        # (created_at DESC, id DESC) is served by a backward scan within a suite, and the
+        # category/priority filters are always combined with suite_id.
+        Index("idx_test_cases_suite_created", "suite_id", "created_at", "id"),
+        Index("idx_test_cases_suite_category", "suite_id", "category"),
+        Index("idx_test_cases_suite_priority", "suite_id", "priority"),
+        # Backs MATCH ... AGAINST in the testcases search filter.
+        Index("idx_test_cases_search", "title", "description", "case_id", mysql_prefix="FULLTEXT"),
+        {"mysql_engine": "InnoDB"},
     )
@@ -9,11 +9,15 @@ Endpoints:
 
 from __future__ import annotations
 
-from typing import List, Optional
+import os
+import re
+import time
+from typing import Any, Dict, Optional, Set, Tuple
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
-from sqlalchemy import func, or_, select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import bindparam, func, insert, inspect, or_, select
+from sqlalchemy.sql import Select
+from sqlalchemy.dialects.mysql import match
 from sqlalchemy.orm import Session
 
 from src.api.db import get_db
@@ -24,25 +28,177 @@ from src.api.schemas import (
     TestCasesPageResponse,
 )
 from src.api.testplan_import import (
-    dumps_json_text,
+    iter_xlsx,
+    normalize_csv,
     normalize_rows,
-    parse_csv,
-    parse_xlsx,
 )
 
 router = APIRouter(tags=["Test Plans"])
 
 
 _MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # 10MB safe default
+_INSERT_BATCH_SIZE = 500  # test cases per bulk INSERT statement
+_SUFFIX_MAP = {".csv": "csv", ".xlsx": "xlsx"}  # upload file extension -> parser format
+
+# Imports write through Core table inserts: no ORM instances, unit of work or identity map.
+# INSERT IGNORE lets the unique constraints drop duplicates server-side.
+_INSERT_SUITES_STMT = insert(Suite.__table__).prefix_with("IGNORE", dialect="mysql")
+_INSERT_TESTCASES_STMT = insert(TestCase.__table__).prefix_with("IGNORE", dialect="mysql")
+
+_SEARCH_WORD_RE = re.compile(r"\w+")
+_FULLTEXT_MIN_WORD_LEN = 3  # InnoDB's default innodb_ft_min_token_size
+_FULLTEXT_INDEX_NAME = "idx_test_cases_search"
+# Whether test_cases has the FULLTEXT index; looked up once per process (None = not yet known).
+_fulltext_ready: Optional[bool] = None
+
+# Last /suites response as (monotonic expiry time, response). An import in this process drops it
+# right away; imports handled by other workers show up once the entry expires, so a cache hit
+# costs no database round trip at all.
+_SUITES_CACHE_TTL_S = 5.0
+_suites_cache: Optional[Tuple[float, Dict[str, Any]]] = None
 
 
 def _require_supported_filename(filename: str) -> str:
-    lower = filename.lower()
-    if lower.endswith(".csv"):
-        return "csv"
-    if lower.endswith(".xlsx"):
-        return "xlsx"
-    raise HTTPException(status_code=400, detail="Unsupported file type. Upload .csv or .xlsx.")
+    # Same semantics as endswith(".csv"/".xlsx"): a bare ".csv" name counts, unlike splitext.
+    _, dot, ext = filename.lower().rpartition(".")
+    fmt = _SUFFIX_MAP.get(dot + ext)
+    if fmt is None:
+        raise HTTPException(status_code=400, detail="Unsupported file type. Upload .csv or .xlsx.")
+    return fmt
+
+
+def _fulltext_query(search: str) -> Optional[str]:
+    """
+    Build a MATCH ... AGAINST boolean-mode query requiring every word (as a prefix).
+
+    Returns None when the search has no words or has words too short for the FULLTEXT index;
+    callers then fall back to a substring match.
+    """
+    words = _SEARCH_WORD_RE.findall(search)
+    if not words or any(len(w) < _FULLTEXT_MIN_WORD_LEN for w in words):
+        return None
+    return " ".join(f"+{w}*" for w in words)
+
+
+def _has_fulltext_index(db: Session) -> bool:
+    """
+    Whether MATCH ... AGAINST can be used on test_cases.
+
+    create_all never adds indexes to an existing table, so a database that predates the FULLTEXT
+    index (see migrations/) would reject MATCH with an error; search then stays on the LIKE
+    shape. Checked once per process: restart after applying the migration.
+    """
+    global _fulltext_ready
+    if _fulltext_ready is None:
+        indexes = inspect(db.get_bind()).get_indexes(TestCase.__tablename__)
+        _fulltext_ready = any(ix["name"] == _FULLTEXT_INDEX_NAME for ix in indexes)
+    return _fulltext_ready
+
+
+def _build_testcases_statements(
+    with_category: bool, with_priority: bool, search_mode: Optional[str]
+) -> Tuple[Select, Select]:
+    """
+    Build the (page, count) statements for one filter shape, fully parameterized.
+
+    search_mode is None, "fulltext" (:search is a boolean-mode query) or "like" (:search is a
+    %pattern%). Values are bound at execute time, so each shape compiles once and then hits
+    SQLAlchemy's compiled-statement cache on every request.
+    """
+    filters = [TestCase.suite_id == bindparam("suite_id")]
+    if with_category:
+        filters.append(TestCase.category == bindparam("category"))
+    if with_priority:
+        filters.append(TestCase.priority == bindparam("priority"))
+    if search_mode == "fulltext":
+        filters.append(
+            match(TestCase.title, TestCase.description, TestCase.case_id, against=bindparam("search")).in_boolean_mode()
+        )
+    elif search_mode == "like":
+        filters.append(
+            or_(
+                TestCase.title.ilike(bindparam("search")),
+                TestCase.description.ilike(bindparam("search")),
+                TestCase.case_id.ilike(bindparam("search")),
+            )
+        )
+
+    # Select plain columns (no ORM instances/identity map); COUNT(*) OVER () returns the
+    # filtered total on every page row, so one query yields both page and total.
+    page_stmt = (
+        select(
+            TestCase.id,
+            TestCase.suite_id,
+            TestCase.case_id,
+            TestCase.title,
+            TestCase.priority,
+            TestCase.category,
+            TestCase.subcategory,
+            TestCase.created_at,
+            func.count().over().label("total_count"),
+        )
+        .where(*filters)
+        .order_by(TestCase.created_at.desc(), TestCase.id.desc())
+        .limit(bindparam("limit"))
+        .offset(bindparam("offset"))
+    )
+    count_stmt = select(func.count(TestCase.id)).where(*filters)
+    return page_stmt, count_stmt
+
+
+# (with_category, with_priority, search_mode) -> (page statement, count statement)
+_TESTCASES_STATEMENTS: Dict[Tuple[bool, bool, Optional[str]], Tuple[Select, Select]] = {
+    (c, p, m): _build_testcases_statements(c, p, m)
+    for c in (False, True)
+    for p in (False, True)
+    for m in (None, "fulltext", "like")
+}
+_SUITE_EXISTS_STMT = select(Suite.id).where(Suite.id == bindparam("suite_id"))
+
+
+def _upload_size(file: UploadFile) -> int:
+    """
+    Return the upload size in bytes without reading it into memory.
+
+    Rejects with 413 as early as possible when the part declares an oversized Content-Length.
+    """
+    declared = file.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > _MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"File too large. Max size is {_MAX_UPLOAD_BYTES} bytes.")
+    if file.size is not None:
+        return file.size
+    size = file.file.seek(0, os.SEEK_END)
+    file.file.seek(0)
+    return size
+
+
+def _resolve_suite_ids(db: Session, names: Set[str]) -> Tuple[Dict[str, int], int]:
+    """
+    Ensure a suite exists for every name and return ({name: suite_id}, suites_created).
+
+    Costs O(1) queries regardless of row count: one SELECT ... IN (...) for existing suites,
+    then (only if some are missing) one INSERT IGNORE and one SELECT for the new ids.
+    """
+    if not names:
+        return {}, 0
+
+    def _select_ids(wanted: Set[str]) -> Dict[str, int]:
+        return dict(db.execute(select(Suite.name, Suite.id).where(Suite.name.in_(wanted))).all())
+
+    suite_ids = _select_ids(names)
+    missing = names - suite_ids.keys()
+    suites_created = 0
+    if missing:
+        result = db.connection().execute(_INSERT_SUITES_STMT, [{"name": n} for n in missing])
+        suites_created = result.rowcount
+        suite_ids.update(_select_ids(missing))
+
+    # MySQL's default collation compares names case-insensitively, so the stored name may differ
+    # in case from the imported one; resolve those stragglers individually.
+    for name in names - suite_ids.keys():
+        suite_ids[name] = db.execute(select(Suite.id).where(Suite.name == name)).scalar_one()
+
+    return suite_ids, suites_created
 
 
 @router.post(
@@ -69,65 +225,52 @@ async def import_testplan(
     Returns summary counts and a preview of the first 10 normalized rows.
     """
     fmt = _require_supported_filename(file.filename or "")
-    raw = await file.read()
+    size = _upload_size(file)
 
-    if len(raw) == 0:
+    if size == 0:
         raise HTTPException(status_code=400, detail="Uploaded file is empty.")
-    if len(raw) > _MAX_UPLOAD_BYTES:
+    if size > _MAX_UPLOAD_BYTES:
         raise HTTPException(status_code=413, detail=f"File too large. Max size is {_MAX_UPLOAD_BYTES} bytes.")
 
+    # Stream rows straight from the spooled upload into normalization; raw rows are
+    # released as soon as they are normalized.
+    file.file.seek(0)
     if fmt == "csv":
-        raw_rows = parse_csv(raw)
+        normalized, warnings = normalize_csv(file.file)
     else:
-        raw_rows = parse_xlsx(raw)
+        normalized, warnings = normalize_rows(iter_xlsx(file.file))
 
-    normalized, warnings = normalize_rows(raw_rows)
+    # One transaction for the whole import: no intermediate flushes or savepoints, and any
+    # structural error rolls back everything instead of leaving a partial import.
+    with db.begin():
+        suite_ids, suites_created = _resolve_suite_ids(db, {row.suite_name for row in normalized})
 
-    suites_created = 0
-    testcases_created = 0
-    duplicates_skipped = 0
-
-    # Cache suites by name to reduce queries.
-    suite_cache: dict[str, Suite] = {}
-
-    for row in normalized:
-        suite = suite_cache.get(row.suite_name)
-        if suite is None:
-            suite = db.execute(select(Suite).where(Suite.name == row.suite_name)).scalar_one_or_none()
-            if suite is None:
-                suite = Suite(name=row.suite_name)
-                db.add(suite)
-                try:
-                    db.flush()  # allocate suite.id
-                    suites_created += 1
-                except IntegrityError:
-                    db.rollback()
-                    suite = db.execute(select(Suite).where(Suite.name == row.suite_name)).scalar_one()
-            suite_cache[row.suite_name] = suite
-
-        tc = TestCase(
-            suite_id=suite.id,
-            case_id=row.case_id,
-            title=row.title,
-            description=row.description,
-            priority=row.priority,
-            category=row.category,
-            subcategory=row.subcategory,
-            preconditions=row.preconditions,
-            steps=dumps_json_text(row.steps),
-            expected_result=row.expected_result,
-            tags=dumps_json_text(row.tags),
-        )
-        db.add(tc)
-        try:
-            db.flush()
-            testcases_created += 1
-        except IntegrityError:
-            # Likely duplicate suite_id+case_id unique constraint.
-            db.rollback()
-            duplicates_skipped += 1
+        # Bulk insert in batches; uq_suite_case_id makes INSERT IGNORE skip duplicates, so anything
+        # not inserted was a duplicate.
+        conn = db.connection()
+        testcases_created = 0
+        for start in range(0, len(normalized), _INSERT_BATCH_SIZE):
+            payload = [
+                {
+                    "suite_id": suite_ids[row.suite_name],
+                    "case_id": row.case_id,
+                    "title": row.title,
+                    "description": row.description,
+                    "priority": row.priority,
+                    "category": row.category,
+                    "subcategory": row.subcategory,
+                    "preconditions": row.preconditions,
+                    "steps": row.steps,
+                    "expected_result": row.expected_result,
+                    "tags": row.tags,
+                }
+                for row in normalized[start : start + _INSERT_BATCH_SIZE]
+            ]
+            testcases_created += conn.execute(_INSERT_TESTCASES_STMT, payload).rowcount
+        duplicates_skipped = len(normalized) - testcases_created
 
-    db.commit()
+    global _suites_cache
+    _suites_cache = None
 
     preview = [r.to_preview_dict() for r in normalized[:10]]
     return ImportTestPlanResponse(
@@ -146,18 +289,29 @@ async def import_testplan(
     description="Returns all suites with their test case counts.",
     operation_id="list_suites",
 )
-def list_suites(db: Session = Depends(get_db)) -> SuitesListResponse:
-    """List suites with counts of test cases."""
+def list_suites(db: Session = Depends(get_db)) -> Dict[str, Any]:
+    """
+    List suites with counts of test cases.
+
+    Served from a short-lived in-process cache (_SUITES_CACHE_TTL_S) between imports.
+    Returns a plain dict: FastAPI validates it against response_model once, instead of a
+    second pass over a pre-built SuitesListResponse.
+    """
+    global _suites_cache
+    cached = _suites_cache
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
     stmt = (
         select(Suite.id, Suite.name, Suite.created_at, func.count(TestCase.id).label("cnt"))
         .select_from(Suite)
         .join(TestCase, TestCase.suite_id == Suite.id, isouter=True)
         .group_by(Suite.id, Suite.name, Suite.created_at)
-        .order_by(Suite.created_at.desc())
+        .order_by(Suite.created_at.desc(), Suite.id.desc())
     )
     rows = db.execute(stmt).all()
-    return SuitesListResponse(
-        suites=[
+    response = {
+        "suites": [
             {
                 "id": r.id,
                 "name": r.name,
@@ -166,7 +320,9 @@ def list_suites(db: Session = Depends(get_db)) -> SuitesListResponse:
             }
             for r in rows
         ]
-    )
+    }
+    _suites_cache = (time.monotonic() + _SUITES_CACHE_TTL_S, response)
+    return response
 
 
 @router.get(
@@ -175,7 +331,8 @@ def list_suites(db: Session = Depends(get_db)) -> SuitesListResponse:
     summary="List test cases for a suite (paginated, filterable)",
     description=(
         "Returns paginated test cases for a given suite. "
-        "Supports filters: category, priority, search (matches title/description/case_id)."
+        "Supports filters: category, priority, search (full-text word-prefix match on "
+        "title/description/case_id)."
     ),
     operation_id="list_suite_testcases",
 )
@@ -185,56 +342,63 @@ def list_suite_testcases(
     page_size: int = Query(20, ge=1, le=200, description="Page size (max 200)."),
     category: Optional[str] = Query(None, description="Filter by exact category."),
     priority: Optional[str] = Query(None, description="Filter by exact priority."),
-    search: Optional[str] = Query(None, min_length=1, description="Search in title/description/case_id (contains, case-insensitive)."),
+    search: Optional[str] = Query(
+        None,
+        min_length=1,
+        description=(
+            "Search in title/description/case_id. Every word must match as a word prefix (full-text); "
+            "searches containing words shorter than 3 characters use a case-insensitive contains match."
+        ),
+    ),
     db: Session = Depends(get_db),
-) -> TestCasesPageResponse:
-    """Paginated retrieval of test cases for a suite with basic filters."""
-    suite = db.execute(select(Suite).where(Suite.id == suite_id)).scalar_one_or_none()
-    if suite is None:
+) -> Dict[str, Any]:
+    """
+    Paginated retrieval of test cases for a suite with basic filters.
+
+    Returns a plain dict that FastAPI validates once against response_model.
+    """
+    if db.execute(_SUITE_EXISTS_STMT, {"suite_id": suite_id}).scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Suite not found.")
 
-    filters = [TestCase.suite_id == suite_id]
+    params: Dict[str, Any] = {"suite_id": suite_id, "limit": page_size, "offset": (page - 1) * page_size}
     if category:
-        filters.append(TestCase.category == category)
+        params["category"] = category
     if priority:
-        filters.append(TestCase.priority == priority)
+        params["priority"] = priority
+    search_mode: Optional[str] = None
     if search:
-        like = f"%{search}%"
-        filters.append(
-            or_(
-                TestCase.title.ilike(like),
-                TestCase.description.ilike(like),
-                TestCase.case_id.ilike(like),
-            )
-        )
-
-    total = db.execute(select(func.count(TestCase.id)).where(*filters)).scalar_one()
+        fulltext = _fulltext_query(search) if _has_fulltext_index(db) else None
+        if fulltext is not None:
+            search_mode, params["search"] = "fulltext", fulltext
+        else:
+            search_mode, params["search"] = "like", f"%{search}%"
 
-    stmt = (
-        select(TestCase)
-        .where(*filters)
-        .order_by(TestCase.created_at.desc(), TestCase.id.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-    )
-    items: List[TestCase] = list(db.execute(stmt).scalars().all())
+    page_stmt, count_stmt = _TESTCASES_STATEMENTS[(bool(category), bool(priority), search_mode)]
+    rows = db.execute(page_stmt, params).all()
+    if rows:
+        total = rows[0].total_count
+    elif page > 1:
+        # Past the last page there are no rows to carry the window count.
+        total = db.execute(count_stmt, params).scalar_one()
+    else:
+        total = 0
 
-    return TestCasesPageResponse(
-        items=[
+    return {
+        "items": [
             {
-                "id": tc.id,
-                "suite_id": tc.suite_id,
-                "case_id": tc.case_id,
-                "title": tc.title,
-                "priority": tc.priority,
-                "category": tc.category,
-                "subcategory": tc.subcategory,
-                "created_at": tc.created_at,
+                "id": r.id,
+                "suite_id": r.suite_id,
+                "case_id": r.case_id,
+                "title": r.title,
+                "priority": r.priority,
+                "category": r.category,
+                "subcategory": r.subcategory,
+                "created_at": r.created_at,
             }
-            for tc in items
+            for r in rows
         ],
-        total=int(total or 0),
-        page=page,
-        page_size=page_size,
-        filters={"suite_id": suite_id, "category": category, "priority": priority, "search": search},
-    )
+        "total": int(total or 0),
+        "page": page,
+        "page_size": page_size,
+        "filters": {"suite_id": suite_id, "category": category, "priority": priority, "search": search},
+    }
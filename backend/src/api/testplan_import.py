@@ -13,14 +13,21 @@ Normalization target fields:
 from __future__ import annotations
 
 import csv
+import importlib.util
 import io
-import json
+import re
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from datetime import date, datetime, time
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
+import orjson
 from fastapi import HTTPException
 
 
+# CSV entry points accept an open binary stream or the raw upload bytes.
+CsvSource = Union[IO[bytes], bytes, bytearray]
+
+
 _STANDARD_FIELDS = [
     "suite_name",
     "case_id",
@@ -36,8 +43,15 @@ _STANDARD_FIELDS = [
 ]
 
 
+# str.translate table deleting every non-alphanumeric ASCII character.
+_NORM_DELETE_TABLE = {c: None for c in range(128) if not chr(c).isalnum()}
+
+
 def _norm_key(s: str) -> str:
     """Normalize a header key for matching (lowercase, remove non-alphanum)."""
+    if s.isascii():
+        # Single C-level pass; equivalent to the generic path below for ASCII input.
+        return s.lower().translate(_NORM_DELETE_TABLE)
     return "".join(ch for ch in s.strip().lower() if ch.isalnum())
 
 
@@ -84,11 +98,13 @@ _HEADER_SYNONYMS: Dict[str, str] = {
     "tags": "tags",
     "tag": "tags",
 }
+# Standard field names match themselves, so header matching is a single dict lookup.
+_HEADER_SYNONYMS.update({f: f for f in _STANDARD_FIELDS if f not in _HEADER_SYNONYMS})
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedRow:
-    """Normalized import row with standard fields."""
+    """Normalized import row with standard fields (slotted: one instance per imported row)."""
     suite_name: str
     case_id: Optional[str]
     title: str
@@ -118,6 +134,12 @@ class NormalizedRow:
         }
 
 
+# Compiled once: steps split on CRLF, CR or LF, tags on comma or semicolon. Pieces are stripped
+# afterwards; keeping whitespace out of the patterns keeps the split linear on long blank runs.
+_EOL_SPLIT_RE = re.compile(r"\r\n?|\n")
+_TAGSEP_RE = re.compile(r"[,;]")
+
+
 def _split_multiline_steps(value: Optional[str]) -> Optional[List[str]]:
     if value is None:
         return None
@@ -125,8 +147,7 @@ def _split_multiline_steps(value: Optional[str]) -> Optional[List[str]]:
     if not v:
         return None
     # Common patterns: "1. ...\n2. ..." or newline-separated bullets.
-    parts = [p.strip() for p in v.replace("\r\n", "\n").replace("\r", "\n").split("\n")]
-    parts = [p for p in parts if p]
+    parts = [p.strip() for p in _EOL_SPLIT_RE.split(v) if p.strip()]
     return parts or None
 
 
@@ -137,8 +158,7 @@ def _split_tags(value: Optional[str]) -> Optional[List[str]]:
     if not v:
         return None
     # Accept comma/semicolon separated.
-    raw = [p.strip() for p in v.replace(";", ",").split(",")]
-    raw = [p for p in raw if p]
+    raw = [p.strip() for p in _TAGSEP_RE.split(v) if p.strip()]
     return raw or None
 
 
@@ -150,19 +170,86 @@ def _map_headers(headers: Sequence[str]) -> Dict[int, str]:
     """
     mapping: Dict[int, str] = {}
     for idx, h in enumerate(headers):
-        nk = _norm_key(h)
-        if nk in _HEADER_SYNONYMS:
-            mapping[idx] = _HEADER_SYNONYMS[nk]
-        elif nk in _STANDARD_FIELDS:
-            mapping[idx] = nk
+        std = _HEADER_SYNONYMS.get(_norm_key(h))
+        if std is not None:
+            mapping[idx] = std
     return mapping
 
 
+def _require_title_column(headers: Sequence[str], kind: str) -> None:
+    """
+    Reject a header row that has no title/name column (400).
+
+    Every data row would be skipped with a warning anyway, so fail before reading the body.
+    """
+    if "title" not in _map_headers(headers).values():
+        raise HTTPException(status_code=400, detail=f"{kind} must include a title or name column.")
+
+
 def _coerce_str(v: Any) -> Optional[str]:
     if v is None:
         return None
+    if isinstance(v, str):
+        # Most cells are already str (all CSV cells); skip the str() call.
+        s = v.strip()
+        return s or None
     s = str(v).strip()
-    return s if s else None
+    return s or None
+
+
+# Per-field extractor from a raw cell value; steps/tags split straight from the cell (the split
+# helpers strip and treat blanks as None themselves), everything else is coerced to a stripped str.
+_FIELD_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    **{f: _coerce_str for f in _STANDARD_FIELDS},
+    "steps": _split_multiline_steps,
+    "tags": _split_tags,
+}
+
+# Fields drawn from a handful of distinct values per import; rows share one str object each.
+_POOLED_FIELDS = ("suite_name", "priority", "category", "subcategory")
+
+
+def _build_row(i: int, vals: Dict[str, Any], warnings: List[str], pool: Dict[str, str]) -> Optional[NormalizedRow]:
+    """
+    Build a NormalizedRow from {standard_field: extracted value} for input row `i` (1-based).
+
+    `pool` is a per-import string pool used to deduplicate low-cardinality field values.
+    Returns None (and records a warning) when the row has no title.
+    """
+    if not vals.get("title"):
+        warnings.append(f"Row {i}: missing title/name; skipped.")
+        return None
+
+    for k in _POOLED_FIELDS:
+        v = vals.get(k)
+        if v is not None:
+            vals[k] = pool.setdefault(v, v)
+
+    return NormalizedRow(
+        suite_name=vals.get("suite_name") or "Default",
+        case_id=vals.get("case_id"),
+        title=vals["title"],
+        description=vals.get("description"),
+        priority=vals.get("priority"),
+        category=vals.get("category"),
+        subcategory=vals.get("subcategory"),
+        preconditions=vals.get("preconditions"),
+        steps=vals.get("steps"),
+        expected_result=vals.get("expected_result"),
+        tags=vals.get("tags"),
+    )
+
+
+def _row_from_fields(
+    i: int, key_to_val: Dict[str, Any], warnings: List[str], pool: Dict[str, str]
+) -> Optional[NormalizedRow]:
+    """Build a NormalizedRow from a {normalized_key: raw value} dict; unknown keys are ignored."""
+    vals: Dict[str, Any] = {}
+    for k, v in key_to_val.items():
+        fn = _FIELD_COERCERS.get(k)
+        if fn is not None and v is not None:
+            vals[k] = fn(v)
+    return _build_row(i, vals, warnings, pool)
 
 
 def normalize_rows(raw_rows: Iterable[Dict[str, Any]]) -> Tuple[List[NormalizedRow], List[str]]:
@@ -176,9 +263,12 @@ def normalize_rows(raw_rows: Iterable[Dict[str, Any]]) -> Tuple[List[NormalizedR
     """
     warnings: List[str] = []
     normalized: List[NormalizedRow] = []
+    pool: Dict[str, str] = {}
+    # Original header -> standard field. Rows share the same few headers, so each distinct
+    # header is normalized once per import rather than once per cell.
+    header_to_std: Dict[Any, str] = {}
 
     for i, raw in enumerate(raw_rows, start=1):
-        # Build header map per-row keys (stable for CSV; for xlsx it also is stable).
         # We match by normalized keys.
         key_to_val: Dict[str, Any] = {}
         for k, v in raw.items():
@@ -186,76 +276,122 @@ def normalize_rows(raw_rows: Iterable[Dict[str, Any]]) -> Tuple[List[NormalizedR
             # more values than headers). Skip those to avoid 500s during import.
             if k is None:
                 continue
-            std = _HEADER_SYNONYMS.get(_norm_key(str(k)), _norm_key(str(k)))
+            std = header_to_std.get(k)
+            if std is None:
+                nk = _norm_key(str(k))
+                std = _HEADER_SYNONYMS.get(nk, nk)
+                header_to_std[k] = std
             key_to_val[std] = v
 
-        suite_name = _coerce_str(key_to_val.get("suite_name")) or "Default"
-        case_id = _coerce_str(key_to_val.get("case_id"))
-        title = _coerce_str(key_to_val.get("title")) or _coerce_str(key_to_val.get("name")) or ""
-
-        if not title:
-            warnings.append(f"Row {i}: missing title/name; skipped.")
-            continue
-
-        description = _coerce_str(key_to_val.get("description"))
-        priority = _coerce_str(key_to_val.get("priority"))
-        category = _coerce_str(key_to_val.get("category"))
-        subcategory = _coerce_str(key_to_val.get("subcategory"))
-        preconditions = _coerce_str(key_to_val.get("preconditions"))
-        expected_result = _coerce_str(key_to_val.get("expected_result"))
-
-        steps_val = key_to_val.get("steps")
-        steps = _split_multiline_steps(_coerce_str(steps_val)) if steps_val is not None else None
-
-        tags_val = key_to_val.get("tags")
-        tags = _split_tags(_coerce_str(tags_val)) if tags_val is not None else None
-
-        normalized.append(
-            NormalizedRow(
-                suite_name=suite_name,
-                case_id=case_id,
-                title=title,
-                description=description,
-                priority=priority,
-                category=category,
-                subcategory=subcategory,
-                preconditions=preconditions,
-                steps=steps,
-                expected_result=expected_result,
-                tags=tags,
-            )
-        )
+        row = _row_from_fields(i, key_to_val, warnings, pool)
+        if row is not None:
+            normalized.append(row)
 
     return normalized, warnings
 
 
-def parse_csv(file_bytes: bytes, max_rows: int = 50_000) -> List[Dict[str, Any]]:
-    """Parse UTF-8 CSV with headers to a list of dict rows."""
+def _normalize_positional(
+    headers: Sequence[str], rows_iter: Iterable[Sequence[Any]]
+) -> Tuple[List[NormalizedRow], List[str]]:
+    """
+    Normalize positional rows (lists of cell values aligned with `headers`).
+
+    The column -> standard field mapping is computed once from the header row, so no per-row
+    dict keyed by original headers is built and no header is re-normalized per row. Each mapped
+    column carries its field extractor, so per-cell work is a single call with no dispatch.
+    """
+    mapping = _map_headers(headers)
+    # Mirror csv.DictReader for repeated header text: the last column with that exact header
+    # supplies the value, in order of the header's first appearance.
+    last_idx_by_header = {h: idx for idx, h in enumerate(headers)}
+    plan = [
+        (idx, mapping[idx], _FIELD_COERCERS[mapping[idx]]) for idx in last_idx_by_header.values() if idx in mapping
+    ]
+
+    warnings: List[str] = []
+    normalized: List[NormalizedRow] = []
+    pool: Dict[str, str] = {}
+    for i, values in enumerate(rows_iter, start=1):
+        n = len(values)
+        # Short rows read as None for the missing columns, exactly like csv.DictReader's restval.
+        vals = {std: fn(values[idx]) if idx < n else None for idx, std, fn in plan}
+        row = _build_row(i, vals, warnings, pool)
+        if row is not None:
+            normalized.append(row)
+
+    return normalized, warnings
+
+
+def _iter_csv_records(file: CsvSource, max_rows: int) -> Iterator[List[str]]:
+    """
+    Yield the header row, then each non-blank data row, from a UTF-8 CSV binary stream.
+
+    The input is decoded incrementally, so the whole file is never held as one str; raw bytes
+    are read through a BytesIO view rather than decoded up front.
+    """
+    if isinstance(file, (bytes, bytearray)):
+        file = io.BytesIO(file)
+    stream = io.TextIOWrapper(file, encoding="utf-8", newline="")
     try:
-        text = file_bytes.decode("utf-8")
+        reader = csv.reader(stream)
+        headers = next(reader, None)
+        if not headers:
+            raise HTTPException(status_code=400, detail="CSV must include a header row.")
+        _require_title_column(headers, "CSV")
+        yield headers
+
+        count = 0
+        for row in reader:
+            if not row:
+                continue  # blank line; csv.DictReader skips these too
+            count += 1
+            if count > max_rows:
+                raise HTTPException(status_code=413, detail=f"CSV too large; max {max_rows} rows.")
+            yield row
     except UnicodeDecodeError as e:
         raise HTTPException(status_code=400, detail=f"CSV must be UTF-8 encoded: {e}") from e
+    finally:
+        # Don't let the wrapper close the caller's file when it is garbage collected.
+        stream.detach()
 
-    reader = csv.DictReader(io.StringIO(text))
-    if not reader.fieldnames:
-        raise HTTPException(status_code=400, detail="CSV must include a header row.")
 
-    rows: List[Dict[str, Any]] = []
-    for i, row in enumerate(reader, start=1):
-        if i > max_rows:
-            raise HTTPException(status_code=413, detail=f"CSV too large; max {max_rows} rows.")
-        rows.append(row)
-    return rows
+def normalize_csv(file: CsvSource, max_rows: int = 50_000) -> Tuple[List[NormalizedRow], List[str]]:
+    """
+    Parse and normalize a UTF-8 CSV binary stream in one positional pass (csv.reader).
+
+    Equivalent to normalize_rows(iter_csv(file)) without building a dict per row.
+    """
+    records = _iter_csv_records(file, max_rows)
+    headers = next(records)
+    return _normalize_positional(headers, records)
 
 
-def parse_xlsx(file_bytes: bytes, max_rows: int = 50_000) -> List[Dict[str, Any]]:
+def iter_csv(file: CsvSource, max_rows: int = 50_000) -> Iterator[Dict[str, Any]]:
     """
-    Parse XLSX first sheet. Requires openpyxl installed.
+    Lazily yield dict rows (csv.DictReader-style) from a UTF-8 CSV binary stream with headers.
 
-    We interpret:
-      - first row as headers
-      - subsequent rows as data
+    Missing trailing values are None; surplus values are collected in a list under key None.
     """
+    records = _iter_csv_records(file, max_rows)
+    headers = next(records)
+    width = len(headers)
+    for values in records:
+        rec: Dict[Any, Any] = dict(zip(headers, values))
+        if len(values) > width:
+            rec[None] = values[width:]
+        else:
+            for h in headers[len(values):]:
+                rec[h] = None
+        yield rec
+
+
+def parse_csv(file: CsvSource, max_rows: int = 50_000) -> List[Dict[str, Any]]:
+    """Parse UTF-8 CSV (binary stream or bytes) with headers to a list of dict rows."""
+    return list(iter_csv(file, max_rows))
+
+
+def _openpyxl_rows(file: IO[bytes], max_rows: int) -> Iterator[Sequence[Any]]:
+    """Yield first-sheet rows as value tuples via openpyxl (read-only streaming mode)."""
     try:
         import openpyxl  # type: ignore
     except Exception as e:  # pragma: no cover
@@ -264,38 +400,117 @@ def parse_xlsx(file_bytes: bytes, max_rows: int = 50_000) -> List[Dict[str, Any]
             detail="XLSX import requires 'openpyxl' dependency installed on the backend.",
         ) from e
 
-    wb = openpyxl.load_workbook(io.BytesIO(file_bytes), read_only=True, data_only=True)
-    sheet = wb.worksheets[0]
-    rows_iter = sheet.iter_rows(values_only=True)
+    wb = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    try:
+        sheet = wb.worksheets[0]
+        # openpyxl parses XML in Python, so a sheet that is sure to exceed max_rows is rejected
+        # before the parse. max_row comes from the sheet's stored <dimension> tag (None if absent),
+        # so this check costs nothing; one row is the header.
+        declared_rows = sheet.max_row or 0
+        if declared_rows > max_rows + 1:
+            raise HTTPException(
+                status_code=413,
+                detail=f"XLSX too large; sheet declares {declared_rows} rows, max {max_rows} data rows.",
+            )
+        yield from sheet.iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def _calamine_value(v: Any) -> Any:
+    """Map a python-calamine cell value onto what openpyxl would return for the same cell."""
+    if v == "":
+        return None  # empty cell
+    if isinstance(v, float) and v.is_integer():
+        return int(v)  # Excel stores all numbers as floats; openpyxl yields ints for whole numbers
+    if type(v) is date:
+        return datetime.combine(v, time())  # openpyxl yields datetimes for date-formatted cells
+    return v
+
+
+def _calamine_rows(file: IO[bytes]) -> Iterator[Sequence[Any]]:
+    """
+    Yield first-sheet rows as value lists via python-calamine (Rust XLSX reader).
+
+    calamine's range starts at the first non-empty cell, so leading blank rows/columns are skipped.
+    """
+    from python_calamine import CalamineWorkbook  # type: ignore
 
+    wb = CalamineWorkbook.from_filelike(file)
     try:
-        headers_row = next(rows_iter)
-    except StopIteration:
-        raise HTTPException(status_code=400, detail="XLSX appears to be empty.")
-
-    headers = [str(h).strip() if h is not None else "" for h in headers_row]
-    if not any(headers):
-        raise HTTPException(status_code=400, detail="XLSX header row is empty.")
-
-    out: List[Dict[str, Any]] = []
-    for idx, row in enumerate(rows_iter, start=1):
-        if idx > max_rows:
-            raise HTTPException(status_code=413, detail=f"XLSX too large; max {max_rows} rows.")
-        rec: Dict[str, Any] = {}
-        for c, h in enumerate(headers):
-            if not h:
+        for row in wb.get_sheet_by_index(0).iter_rows():
+            yield [_calamine_value(v) for v in row]
+    finally:
+        wb.close()
+
+
+def _xlsx_rows(file: IO[bytes], max_rows: int) -> Iterator[Sequence[Any]]:
+    """
+    Yield first-sheet rows as sequences of cell values (None for empty cells).
+
+    Uses python-calamine when installed (optional; several times faster and lighter than
+    openpyxl's Python XML parsing) and falls back to openpyxl otherwise.
+    """
+    if importlib.util.find_spec("python_calamine") is not None:
+        return _calamine_rows(file)
+    return _openpyxl_rows(file, max_rows)
+
+
+def iter_xlsx(file: IO[bytes], max_rows: int = 50_000) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield dict rows from the first XLSX sheet of a binary stream.
+
+    Requires openpyxl installed (or the optional, faster python-calamine).
+
+    We interpret:
+      - first row as headers
+      - subsequent rows as data
+    """
+    rows_iter = _xlsx_rows(file, max_rows)
+    try:
+        try:
+            headers_row = next(rows_iter)
+        except StopIteration:
+            raise HTTPException(status_code=400, detail="XLSX appears to be empty.")
+
+        headers = [str(h).strip() if h is not None else "" for h in headers_row]
+        if not any(headers):
+            raise HTTPException(status_code=400, detail="XLSX header row is empty.")
+        _require_title_column(headers, "XLSX")
+
+        # Only columns with a header are kept; resolve them once instead of per row.
+        active_cols = [(c, h) for c, h in enumerate(headers) if h]
+        max_c = active_cols[-1][0] + 1
+        # Columns whose value ends up in the row dict: for a repeated header only the last one.
+        value_idx = sorted({h: c for c, h in active_cols}.values())
+        # Every column up to the last header supplies a value, so a plain slice covers them.
+        dense = len(value_idx) == max_c
+
+        for idx, row in enumerate(rows_iter, start=1):
+            if idx > max_rows:
+                raise HTTPException(status_code=413, detail=f"XLSX too large; max {max_rows} rows.")
+            # Skip completely empty rows before building a dict for them (trailing blank rows are
+            # common); any() stops at the first non-blank cell.
+            n = len(row)
+            cells = row[:max_c] if dense else [row[c] for c in value_idx if c < n]
+            if not any(v is not None and (not isinstance(v, str) or v.strip()) for v in cells):
                 continue
-            rec[h] = row[c] if c < len(row) else None
-        # Skip completely empty rows.
-        if all(v is None or str(v).strip() == "" for v in rec.values()):
-            continue
-        out.append(rec)
+            if n >= max_c:
+                rec = {h: row[c] for c, h in active_cols}
+            else:
+                rec = {h: row[c] if c < n else None for c, h in active_cols}
+            yield rec
+    finally:
+        rows_iter.close()
+
 
-    return out
+def parse_xlsx(file: IO[bytes], max_rows: int = 50_000) -> List[Dict[str, Any]]:
+    """Parse XLSX first sheet from a binary stream to a list of dict rows."""
+    return list(iter_xlsx(file, max_rows))
 
 
 def dumps_json_text(value: Any) -> Optional[str]:
-    """Dump JSON-serializable value to text, or return None."""
+    """Dump JSON-serializable value to (non-ASCII-escaped) text, or return None."""
     if value is None:
         return None
-    return json.dumps(value, ensure_ascii=False)
+    return orjson.dumps(value).decode("utf-8")